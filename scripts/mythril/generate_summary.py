@@ -5,10 +5,121 @@ This script handles malformed JSON files that contain extra text before the actu
 """
 
 import json
+import mmap
 import os
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+# Prefer orjson when available; the stdlib module exposes the same loads/JSONDecodeError API.
+# run_mythril.py imports this so both scripts share one JSON backend
+try:
+    import orjson as json_backend
+except ImportError:
+    json_backend = json
+
+# Known failure markers in mythril error output, and the category each capture group maps to;
+# groups are listed in precedence order for errors that contain several markers
+_ERROR_CATEGORY_RE = re.compile(r"(Solc experienced a fatal error)|(ParserError)|(SolidityVersionMismatch)")
+_ERROR_CATEGORIES = ("Compilation Error", "Parser Error", "Version Mismatch")
+
+# Display order of summary categories
+_CATEGORY_ORDER = (
+    "Success (No Issues)",
+    "Compilation Error",
+    "Parser Error",
+    "Version Mismatch",
+    "Analysis Error",
+    "Parse Error",
+)
+_ISSUES_CATEGORY_RE = re.compile(r"Success \((\d+) Issues\)")
+
+# Batched results file appended to by run_mythril.py, one record per line holding the
+# contract name, the (mtime_ns, size) of its report, and the parsed result
+ALL_RESULTS_FILENAME = "all_results.ndjson"
+
+# Reports at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
+def _extract_json(content) -> Tuple[Dict[str, Any], str]:
+    """
+    Parse the JSON object embedded in a bytes-like buffer (bytes or mmap).
+    
+    Args:
+        content: Buffer holding the raw report
+        
+    Returns:
+        Tuple of (parsed_json_dict, error_message)
+    """
+    # Find the JSON content by looking for the first '{' and last '}'
+    json_start = content.find(b'{')
+    if json_start == -1:
+        return {}, "No JSON content found"
+    
+    json_end = content.rfind(b'}')
+    if json_end == -1:
+        return {}, "No valid JSON end found"
+    
+    json_content = content[json_start:json_end + 1]
+    
+    # Parse the JSON
+    parsed = json_backend.loads(json_content)
+    return parsed, ""
+
+
+def dump_json_bytes(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to JSON bytes (compact, or indented by two spaces), using orjson when available."""
+    if json_backend is not json:
+        try:
+            return json_backend.dumps(data, option=json_backend.OPT_INDENT_2 if indent else None)
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits, which orjson rejects
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def extract_json_from_bytes(content: bytes) -> Tuple[Dict[str, Any], str]:
+    """
+    Extract JSON content from raw report bytes that may contain extra text.
+    
+    Args:
+        content: Raw report contents
+        
+    Returns:
+        Tuple of (parsed_json_dict, error_message)
+    """
+    try:
+        return _extract_json(content)
+    except json_backend.JSONDecodeError as e:
+        return {}, f"JSON decode error: {str(e)}"
+
+
+def make_result_record(contract_name: str, report_path: str, result: Optional[Dict[str, Any]],
+                       parse_error: str) -> Dict[str, Any]:
+    """
+    Build a batched results record for a report, stamped with the report's (mtime_ns, size).
+    
+    Args:
+        contract_name: Name of the contract
+        report_path: Path to the per-contract report the record was parsed from
+        result: Parsed report, or None to have the summary re-parse the report
+        parse_error: Error message from parsing the report, if any
+        
+    Returns:
+        Record dictionary ready to be written as one NDJSON line
+    """
+    st = os.stat(report_path)
+    return {
+        'contract': contract_name,
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+        'result': result,
+        'error': parse_error
+    }
 
 
 def extract_json_from_file(file_path: str) -> Tuple[Dict[str, Any], str]:
@@ -22,25 +133,15 @@ def extract_json_from_file(file_path: str) -> Tuple[Dict[str, Any], str]:
         Tuple of (parsed_json_dict, error_message)
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Find the JSON content by looking for the first '{' and last '}'
-        json_start = content.find('{')
-        if json_start == -1:
-            return {}, "No JSON content found"
+        with open(file_path, 'rb') as f:
+            # Map large reports instead of copying them into memory; small ones are
+            # cheaper to read outright
+            if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+                return _extract_json(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _extract_json(mm)
         
-        json_end = content.rfind('}')
-        if json_end == -1:
-            return {}, "No valid JSON end found"
-        
-        json_content = content[json_start:json_end + 1]
-        
-        # Parse the JSON
-        parsed = json.loads(json_content)
-        return parsed, ""
-        
-    except json.JSONDecodeError as e:
+    except json_backend.JSONDecodeError as e:
         return {}, f"JSON decode error: {str(e)}"
     except Exception as e:
         return {}, f"Error reading file: {str(e)}"
@@ -64,14 +165,14 @@ def categorize_result(result: Dict[str, Any]) -> str:
     issues = result.get('issues', [])
     
     if not success and error:
-        if "Solc experienced a fatal error" in error:
-            return "Compilation Error"
-        elif "ParserError" in error:
-            return "Parser Error"
-        elif "SolidityVersionMismatch" in error:
-            return "Version Mismatch"
-        else:
-            return "Analysis Error"
+        if not isinstance(error, str):
+            return "Analysis Error"  # e.g. a structured error object
+        # Single pass over the (possibly very long) error text; the highest-precedence
+        # marker wins regardless of where it appears
+        group = min((m.lastindex for m in _ERROR_CATEGORY_RE.finditer(error)), default=None)
+        if group is not None:
+            return _ERROR_CATEGORIES[group - 1]
+        return "Analysis Error"
     elif success and not issues:
         return "Success (No Issues)"
     elif success and issues:
@@ -80,6 +181,27 @@ def categorize_result(result: Dict[str, Any]) -> str:
         return "Unknown"
 
 
+def _category_sort_key(category: str) -> Tuple[int, int, str]:
+    """
+    Sort key placing categories in _CATEGORY_ORDER.
+    
+    "Success (N Issues)" categories sort alongside "Success (No Issues)" by issue count,
+    and unknown categories go last.
+    
+    Args:
+        category: Category string from categorize_result
+        
+    Returns:
+        Sort key tuple
+    """
+    match = _ISSUES_CATEGORY_RE.fullmatch(category)
+    if match:
+        return (0, int(match.group(1)), category)
+    if category in _CATEGORY_ORDER:
+        return (_CATEGORY_ORDER.index(category), 0, category)
+    return (len(_CATEGORY_ORDER), 0, category)
+
+
 def truncate_error(error: str, max_length: int = 100) -> str:
     """
     Truncate error message for display in table.
@@ -97,6 +219,132 @@ def truncate_error(error: str, max_length: int = 100) -> str:
     return error[:max_length] + "..."
 
 
+def _summarize_result(contract_name: str, result: Dict[str, Any], parse_error: str) -> Dict[str, Any]:
+    """
+    Build the summary entry for a single contract.
+    
+    Args:
+        contract_name: Name of the analyzed contract
+        result: Parsed JSON result from mythril
+        parse_error: Error message if the result could not be parsed
+        
+    Returns:
+        Dictionary with contract, category, issue_count, error and full_result, plus
+        the derived is_success, issues_list and issue_count_int fields
+    """
+    issues_list = None
+    if parse_error:
+        category = "Parse Error"
+        error_msg = parse_error
+        issue_count = "N/A"
+    else:
+        category = categorize_result(result)
+        error_msg = result.get('error', '')
+        issues = result.get('issues', [])
+        if isinstance(issues, list):
+            issue_count = len(issues)
+            issues_list = issues or None
+        else:
+            issue_count = "N/A"
+    
+    # Derived fields are precomputed so rendering needs no repeated lookups
+    return {
+        'contract': contract_name,
+        'category': category,
+        'issue_count': issue_count,
+        'error': error_msg,
+        'full_result': result,
+        'is_success': category.startswith('Success'),
+        'issues_list': issues_list,
+        'issue_count_int': issue_count if isinstance(issue_count, int) else 0
+    }
+
+
+def _parse_one(file_path: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Parse and categorize a single mythril report file.
+    
+    Kept at module level so it can be dispatched to worker processes.
+    
+    Args:
+        file_path: Path to the mythril JSON file
+        
+    Returns:
+        Tuple of (summary entry, batched results record or None if the report vanished)
+    """
+    contract_name = os.path.basename(file_path).replace('.json', '')
+    # Stamp the record before reading, so a report rewritten mid-read is seen as stale next time
+    try:
+        record = make_result_record(contract_name, file_path, None, "")
+    except OSError:
+        record = None
+    result, parse_error = extract_json_from_file(file_path)
+    if record is not None:
+        record['result'] = result
+        record['error'] = parse_error
+    return _summarize_result(contract_name, result, parse_error), record
+
+
+def load_batched_records(ndjson_path: str) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Read the batched NDJSON results file written by run_mythril.py.
+    
+    Args:
+        ndjson_path: Path to the batched results file
+        
+    Returns:
+        Tuple of (latest record per contract, number of lines in the file)
+    """
+    records = {}
+    line_count = 0
+    try:
+        with open(ndjson_path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                line_count += 1
+                try:
+                    record = json_backend.loads(line)
+                except ValueError:
+                    continue  # e.g. a line cut short by an interrupted run
+                # Later lines win, so re-analyzed contracts replace their earlier records
+                if isinstance(record, dict) and isinstance(record.get('contract'), str):
+                    records[record['contract']] = record
+    except OSError:
+        pass
+    return records, line_count
+
+
+def write_batched_records(ndjson_path: str, records: List[Dict[str, Any]]):
+    """
+    Atomically replace the batched NDJSON results file with the given records.
+    
+    Args:
+        ndjson_path: Path to the batched results file
+        records: Records to write, one per line
+    """
+    tmp_path = ndjson_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            for record in records:
+                f.write(dump_json_bytes(record) + b'\n')
+        os.replace(tmp_path, ndjson_path)
+    except OSError as e:
+        print(f"Warning: could not rewrite {ndjson_path}: {str(e)}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _is_fresh_record(record: Optional[Dict[str, Any]], entry: os.DirEntry) -> bool:
+    """Check that a batched record was parsed from the report as it exists now."""
+    if record is None or not isinstance(record.get('result'), dict):
+        return False
+    st = entry.stat()
+    return record.get('mtime_ns') == st.st_mtime_ns and record.get('size') == st.st_size
+
+
 def generate_summary_table(mythril_dir: str) -> str:
     """
     Generate a formatted markdown document for all JSON files in the mythril directory.
@@ -107,124 +355,131 @@ def generate_summary_table(mythril_dir: str) -> str:
     Returns:
         Markdown formatted summary document
     """
+    # Get all JSON files, skipping hidden bookkeeping files such as the analyzed index
+    with os.scandir(mythril_dir) as entries:
+        reports = {
+            e.name.replace('.json', ''): e for e in entries
+            if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file()
+        }
+    
+    # Use batched records whose (mtime_ns, size) still match their report; only the
+    # remaining reports need to be read and parsed individually
+    ndjson_path = os.path.join(mythril_dir, ALL_RESULTS_FILENAME)
+    records, line_count = load_batched_records(ndjson_path)
     results = []
+    fresh_records = []
+    stale_paths = []
+    for contract_name, entry in reports.items():
+        record = records.get(contract_name)
+        if _is_fresh_record(record, entry):
+            results.append(_summarize_result(contract_name, record['result'], record.get('error') or ""))
+            fresh_records.append(record)
+        else:
+            stale_paths.append(entry.path)
     
-    # Get all JSON files
-    json_files = sorted([f for f in os.listdir(mythril_dir) if f.endswith('.json')])
+    if stale_paths:
+        # Parse reports in parallel; JSON decoding is CPU-bound and would serialize on the GIL
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for summary_entry, record in executor.map(_parse_one, sorted(stale_paths), chunksize=16):
+                results.append(summary_entry)
+                if record is not None:
+                    fresh_records.append(record)
     
-    for json_file in json_files:
-        file_path = os.path.join(mythril_dir, json_file)
-        contract_name = json_file.replace('.json', '')
-        
-        result, parse_error = extract_json_from_file(file_path)
-        
-        if parse_error:
-            category = "Parse Error"
-            error_msg = parse_error
-            issue_count = "N/A"
-        else:
-            category = categorize_result(result)
-            error_msg = result.get('error', '')
-            issues = result.get('issues', [])
-            issue_count = len(issues) if isinstance(issues, list) else "N/A"
-        
-        results.append({
-            'contract': contract_name,
-            'category': category,
-            'issue_count': issue_count,
-            'error': error_msg,
-            'full_result': result
-        })
+    # Rebuild the batched file when it was missing records or carries superseded or
+    # orphaned lines, so the next summary can be served from it alone
+    if stale_paths or line_count != len(fresh_records):
+        fresh_records.sort(key=itemgetter('contract'))
+        write_batched_records(ndjson_path, fresh_records)
+    results.sort(key=itemgetter('contract'))
     
     # Generate formatted markdown document
-    markdown = "# Mythril Analysis Summary\n\n"
-    markdown += f"**Total contracts analyzed:** {len(results)}\n\n"
+    parts = ["# Mythril Analysis Summary\n\n"]
+    parts.append(f"**Total contracts analyzed:** {len(results)}\n\n")
     
-    # Count by category
-    categories = {}
+    # Group results by category in a single pass; counts come from the group sizes
+    grouped_results = defaultdict(list)
     for result in results:
-        cat = result['category']
-        categories[cat] = categories.get(cat, 0) + 1
+        grouped_results[result['category']].append(result)
+    categories = {category: len(contracts) for category, contracts in grouped_results.items()}
     
-    markdown += "## Overview\n\n"
-    for category, count in sorted(categories.items()):
-        percentage = (count / len(results)) * 100
-        markdown += f"- **{category}**: {count} contracts ({percentage:.1f}%)\n"
+    # Sort categories once into display order for both the overview and the sections
+    ordered_categories = sorted(grouped_results, key=_category_sort_key)
     
-    # Group results by category
-    grouped_results = {}
-    for result in results:
-        category = result['category']
-        if category not in grouped_results:
-            grouped_results[category] = []
-        grouped_results[category].append(result)
+    parts.append("## Overview\n\n")
+    for category in ordered_categories:
+        count = categories[category]
+        percentage = (count / len(results)) * 100
+        parts.append(f"- **{category}**: {count} contracts ({percentage:.1f}%)\n")
     
     # Generate sections for each category
-    for category in sorted(grouped_results.keys()):
+    for category in ordered_categories:
         contracts = grouped_results[category]
-        markdown += f"\n## {category}\n\n"
-        markdown += f"*{len(contracts)} contract(s)*\n\n"
+        parts.append(f"\n## {category}\n\n")
+        parts.append(f"*{len(contracts)} contract(s)*\n\n")
         
-        for contract in sorted(contracts, key=lambda x: x['contract']):
-            markdown += f"### {contract['contract']}\n\n"
+        for contract in sorted(contracts, key=itemgetter('contract')):
+            error = contract['error']
+            issue_count = contract['issue_count']
+            parts.append(f"### {contract['contract']}\n\n")
             
-            if contract['category'].startswith('Success'):
-                if contract['issue_count'] == 0:
-                    markdown += "✅ **Status**: Analysis completed successfully with no issues found.\n\n"
+            if contract['is_success']:
+                if issue_count == 0:
+                    parts.append("✅ **Status**: Analysis completed successfully with no issues found.\n\n")
                 else:
-                    markdown += f"⚠️ **Status**: Analysis completed with **{contract['issue_count']} security issues** found.\n\n"
+                    parts.append(f"⚠️ **Status**: Analysis completed with **{issue_count} security issues** found.\n\n")
                     # If there are issues, we could expand this to show them
-                    if contract['full_result'].get('issues'):
-                        markdown += "**Issues found:**\n"
-                        for i, issue in enumerate(contract['full_result']['issues'], 1):
+                    issues_list = contract['issues_list']
+                    if issues_list:
+                        parts.append("**Issues found:**\n")
+                        for i, issue in enumerate(issues_list, 1):
                             title = issue.get('title', 'Unknown Issue')
                             severity = issue.get('severity', 'Unknown')
-                            markdown += f"{i}. **{title}** (Severity: {severity})\n"
-                        markdown += "\n"
+                            parts.append(f"{i}. **{title}** (Severity: {severity})\n")
+                        parts.append("\n")
             
-            elif contract['category'] in ['Compilation Error', 'Parser Error', 'Version Mismatch', 'Analysis Error']:
-                markdown += f"❌ **Status**: {contract['category']}\n\n"
-                if contract['error']:
-                    markdown += "**Error Details:**\n```\n"
-                    markdown += contract['error']
-                    markdown += "\n```\n\n"
+            elif category in ['Compilation Error', 'Parser Error', 'Version Mismatch', 'Analysis Error']:
+                parts.append(f"❌ **Status**: {category}\n\n")
+                if error:
+                    parts.append("**Error Details:**\n```\n")
+                    parts.append(error)
+                    parts.append("\n```\n\n")
             
-            elif contract['category'] == 'Parse Error':
-                markdown += "❌ **Status**: Failed to parse analysis results\n\n"
-                if contract['error']:
-                    markdown += f"**Error**: {contract['error']}\n\n"
+            elif category == 'Parse Error':
+                parts.append("❌ **Status**: Failed to parse analysis results\n\n")
+                if error:
+                    parts.append(f"**Error**: {error}\n\n")
             
             else:
-                markdown += f"❓ **Status**: {contract['category']}\n\n"
-                if contract['error']:
-                    markdown += f"**Details**: {contract['error']}\n\n"
+                parts.append(f"❓ **Status**: {category}\n\n")
+                if error:
+                    parts.append(f"**Details**: {error}\n\n")
     
     # Add recommendations section
-    markdown += "## Recommendations\n\n"
+    parts.append("## Recommendations\n\n")
     
     if 'Compilation Error' in categories:
         compilation_errors = categories['Compilation Error']
-        markdown += f"### Compilation Issues ({compilation_errors} contracts)\n\n"
-        markdown += "Several contracts failed to compile. Common issues and solutions:\n\n"
-        markdown += "- **Stack too deep errors**: Add `--via-ir` flag when compiling or enable optimizer\n"
-        markdown += "- **Missing dependencies**: Ensure all OpenZeppelin contracts are properly installed\n"
-        markdown += "- **Version mismatches**: Check Solidity version requirements in pragma statements\n\n"
+        parts.append(f"### Compilation Issues ({compilation_errors} contracts)\n\n")
+        parts.append("Several contracts failed to compile. Common issues and solutions:\n\n")
+        parts.append("- **Stack too deep errors**: Add `--via-ir` flag when compiling or enable optimizer\n")
+        parts.append("- **Missing dependencies**: Ensure all OpenZeppelin contracts are properly installed\n")
+        parts.append("- **Version mismatches**: Check Solidity version requirements in pragma statements\n\n")
     
     if 'Success (No Issues)' in categories:
         success_count = categories['Success (No Issues)']
-        markdown += f"### Successfully Analyzed ({success_count} contracts)\n\n"
-        markdown += "These contracts compiled and analyzed successfully with no security issues detected by Mythril.\n\n"
+        parts.append(f"### Successfully Analyzed ({success_count} contracts)\n\n")
+        parts.append("These contracts compiled and analyzed successfully with no security issues detected by Mythril.\n\n")
     
     # Add summary of analysis types that found issues
-    issue_contracts = [r for r in results if r['category'].startswith('Success (') and r['issue_count'] > 0]
+    issue_contracts = [r for r in results if r['is_success'] and r['issue_count_int'] > 0]
     if issue_contracts:
-        markdown += f"### Security Issues Found ({len(issue_contracts)} contracts)\n\n"
-        markdown += "Review the detailed results above for specific security issues that need attention.\n\n"
+        parts.append(f"### Security Issues Found ({len(issue_contracts)} contracts)\n\n")
+        parts.append("Review the detailed results above for specific security issues that need attention.\n\n")
     
-    markdown += "---\n\n"
-    markdown += f"*Report generated on {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+    parts.append("---\n\n")
+    parts.append(f"*Report generated on {datetime.now():%Y-%m-%d %H:%M:%S}*\n")
     
-    return markdown
+    return "".join(parts)
 
 
 def main():
@@ -11,16 +11,44 @@ This script provides comprehensive mythril security analysis with the following
 """
 
 import argparse
-import json
+import asyncio
 import os
+import re
+import selectors
+import signal
 import subprocess
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set, Optional, Dict, Any
+from typing import List, Set, Optional, Dict, Any, Tuple
 import threading
 
+# Shared with the summary script, which lives alongside this one
+from generate_summary import (
+    ALL_RESULTS_FILENAME, dump_json_bytes as _dump_bytes, extract_json_from_bytes,
+    json_backend as _json, make_result_record
+)
+
+# Directory names excluded from analysis (mirrors the original Makefile exclude patterns)
+EXCLUDED_DIR_NAMES = {"mocks", "test", "testing", "dependencies", "dlend", "interface", "interfaces"}
+
+# Filenames of mock/test contracts, plus interface files (starting with I and uppercase)
+_EXCLUDE_FILENAME_RE = re.compile(r"(?:Mock|mock|Test|test|Fake|fake)|^I[A-Z]")
+
+# Abstract-contract detection stops after the head of a source file when an abstract
+# contract already shows up there; files no longer than this are read in one call
+_HEAD_READ_BYTES = 8192
+
+# Extra time given to a mythril process beyond its execution timeout for cleanup
+_PROCESS_GRACE_SECONDS = 30
+
+# Maximum number of bytes read from a mythril pipe at a time
+_PIPE_READ_BYTES = 64 * 1024
+
+# Number of threads reading report files concurrently when re-validating results
+_REPORT_READ_THREADS = 32
+
 # Thread-safe printing
 print_lock = threading.Lock()
 
@@ -33,10 +61,274 @@ def safe_print(message: str, flush: bool = True):
         # Handle broken pipe gracefully (e.g., when output is piped to head)
         pass
 
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write raw bytes to path through a temporary file and rename, bypassing Python's buffered I/O."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def _write_failure(path: Path, reason: str) -> Dict[str, Any]:
+    """Write a failed-analysis report to path and return its contents."""
+    failure = {'success': False, 'error': reason, 'issues': []}
+    _atomic_write_bytes(path, _dump_bytes(failure, indent=True))
+    return failure
+
+def _append_result_record(reports_dir: Path, contract_name: str, output_file: Path,
+                          result: Optional[Dict[str, Any]], parse_error: str = ""):
+    """Append a contract's parsed report (None to have the summary re-parse it) to the batched results file."""
+    try:
+        line = _dump_bytes(make_result_record(contract_name, str(output_file), result, parse_error)) + b'\n'
+        with open(reports_dir / ALL_RESULTS_FILENAME, 'ab') as f:
+            f.write(line)
+    except OSError as e:
+        safe_print(f"   ⚠️  Could not append {contract_name} to {ALL_RESULTS_FILENAME}: {str(e)}")
+
+def _reset_result_records(reports_dir: Path):
+    """Truncate the batched results file ahead of a run that re-analyzes every contract."""
+    try:
+        with open(reports_dir / ALL_RESULTS_FILENAME, 'wb'):
+            pass
+    except OSError as e:
+        safe_print(f"⚠️  Could not reset {ALL_RESULTS_FILENAME}: {str(e)}")
+
+def build_mythril_command(repo_root: Path, contract_path: Path, timeout: int = 120,
+                          max_depth: Optional[int] = None,
+                          call_depth_limit: Optional[int] = None,
+                          transaction_count: Optional[int] = None) -> List[str]:
+    """Build the mythril command line for a single contract."""
+    cmd = [
+        "myth", "analyze", str(contract_path),
+        "--execution-timeout", str(timeout),
+        "--solv", "0.8.20",
+        "--solc-json", str(repo_root / "mythril-config.json"),
+        "-o", "json"
+    ]
+    
+    # Add optional parameters
+    if max_depth:
+        cmd.extend(["--max-depth", str(max_depth)])
+    if call_depth_limit:
+        cmd.extend(["--call-depth-limit", str(call_depth_limit)])
+    if transaction_count:
+        cmd.extend(["-t", str(transaction_count)])
+    
+    return cmd
+
+def record_analysis_output(repo_root: Path, reports_dir: Path, contract_path: Path,
+                           returncode: int, stdout: bytes, stderr: bytes,
+                           analysis_time: float) -> Dict[str, Any]:
+    """
+    Save the output of a finished mythril run and report its status.
+    
+    Args:
+        repo_root: Repository root directory
+        reports_dir: Directory where mythril reports are written
+        contract_path: Path to the analyzed contract
+        returncode: Exit code of the mythril process
+        stdout: Captured standard output, as raw bytes
+        stderr: Captured standard error, as raw bytes
+        analysis_time: Wall time of the analysis in seconds
+        
+    Returns:
+        Dictionary with analysis results
+    """
+    contract_name = contract_path.stem
+    output_file = reports_dir / f"{contract_name}.json"
+    
+    # Save output to file
+    _atomic_write_bytes(output_file, stdout)
+    
+    # Parse the output once, the same way the summary does; it feeds both the status
+    # and the batched results file
+    try:
+        result, parse_error = extract_json_from_bytes(stdout)
+    except Exception:
+        result, parse_error = None, ""
+    output_data = result if not parse_error and isinstance(result, dict) else None
+    _append_result_record(reports_dir, contract_name, output_file,
+                          result if isinstance(result, dict) else None, parse_error)
+    
+    # Determine status
+    if returncode == 0:
+        status = "✅ Success"
+        if output_data is None:
+            status = "✅ Success (no JSON output)"
+        else:
+            issue_count = len(output_data.get('issues', []))
+            if issue_count > 0:
+                status = f"⚠️  Success ({issue_count} issues)"
+    else:
+        status = "❌ Error"
+        if stderr:
+            # Also write stderr to a separate file for debugging
+            error_file = reports_dir / f"{contract_name}_error.txt"
+            _atomic_write_bytes(error_file, b"STDOUT:\n" + stdout + b"\n\nSTDERR:\n" + stderr)
+    
+    safe_print(f"   {status} - {contract_name} ({analysis_time:.1f}s)")
+    
+    return {
+        'contract': contract_name,
+        'path': str(contract_path.relative_to(repo_root)),
+        'status': 'success' if returncode == 0 else 'error',
+        'analysis_time': analysis_time,
+        'output_file': str(output_file.relative_to(repo_root))
+    }
+
+def record_analysis_timeout(repo_root: Path, reports_dir: Path, contract_path: Path,
+                            timeout: int) -> Dict[str, Any]:
+    """Record a mythril run that exceeded its timeout."""
+    contract_name = contract_path.stem
+    output_file = reports_dir / f"{contract_name}.json"
+    
+    safe_print(f"   ⏰ Timeout - {contract_name} (>{timeout}s)")
+    # Create a timeout result file
+    timeout_result = _write_failure(output_file, f'Analysis timed out after {timeout} seconds')
+    _append_result_record(reports_dir, contract_name, output_file, timeout_result)
+    
+    return {
+        'contract': contract_name,
+        'path': str(contract_path.relative_to(repo_root)),
+        'status': 'timeout',
+        'analysis_time': timeout,
+        'output_file': str(output_file.relative_to(repo_root))
+    }
+
+def record_analysis_exception(repo_root: Path, reports_dir: Path, contract_path: Path,
+                              error: Exception) -> Dict[str, Any]:
+    """Record a mythril run that failed with an exception."""
+    contract_name = contract_path.stem
+    output_file = reports_dir / f"{contract_name}.json"
+    
+    safe_print(f"   💥 Exception - {contract_name}: {str(error)}")
+    # Create an error result file
+    error_result = _write_failure(output_file, f'Exception during analysis: {str(error)}')
+    _append_result_record(reports_dir, contract_name, output_file, error_result)
+    
+    return {
+        'contract': contract_name,
+        'path': str(contract_path.relative_to(repo_root)),
+        'status': 'exception',
+        'analysis_time': 0,
+        'output_file': str(output_file.relative_to(repo_root))
+    }
+
+def _kill_process_group(proc: subprocess.Popen):
+    """Kill a mythril process together with any solc processes it spawned."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    proc.wait()
+
+def analyze_contract(repo_root: Path, reports_dir: Path, contract_path: Path, timeout: int = 120,
+                     max_depth: Optional[int] = None,
+                     call_depth_limit: Optional[int] = None,
+                     transaction_count: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Analyze a single contract with mythril, blocking until it finishes.
+    
+    Args:
+        repo_root: Repository root directory
+        reports_dir: Directory where mythril reports are written
+        contract_path: Path to the contract file
+        timeout: Analysis timeout in seconds
+        max_depth: Maximum analysis depth
+        call_depth_limit: Maximum call depth
+        transaction_count: Number of transactions to analyze
+        
+    Returns:
+        Dictionary with analysis results
+    """
+    safe_print(f"🔍 Analyzing {contract_path.relative_to(repo_root)}...")
+    
+    cmd = build_mythril_command(repo_root, contract_path, timeout, max_depth,
+                                call_depth_limit, transaction_count)
+    
+    start_time = time.time()
+    
+    try:
+        # Run mythril analysis
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=timeout + _PROCESS_GRACE_SECONDS
+        )
+        
+        return record_analysis_output(
+            repo_root, reports_dir, contract_path,
+            result.returncode, result.stdout, result.stderr,
+            time.time() - start_time
+        )
+        
+    except subprocess.TimeoutExpired:
+        return record_analysis_timeout(repo_root, reports_dir, contract_path, timeout)
+        
+    except Exception as e:
+        return record_analysis_exception(repo_root, reports_dir, contract_path, e)
+
+
+def _is_successful_report(json_file: Path) -> bool:
+    """Check whether a mythril report holds a successful analysis rather than a failure we recorded."""
+    try:
+        with open(json_file, 'rb') as f:
+            content = f.read()
+            
+        # Try to parse as JSON
+        data = _json.loads(content)
+        
+        # If it has 'success': False, it was a failed analysis we created
+        if isinstance(data, dict) and data.get('success') is False:
+            return False  # Failed analyses should be re-run
+        
+        # If it has 'error' key with an actual error message, it was a failed analysis we created
+        if isinstance(data, dict) and data.get('error') and data.get('error') != None:
+            return False  # Failed analyses should be re-run
+        
+        # If we get here, it's likely a successful mythril output
+        # (either has success: true, or error: null, or is standard mythril JSON with issues array)
+        return True
+        
+    except (_json.JSONDecodeError, FileNotFoundError, Exception):
+        # If we can't parse the JSON or read the file, treat as failed analysis
+        # and let it be re-run
+        return False
+
+
+def _is_valid_index_entry(entry: Any) -> bool:
+    """Check that an analyzed-index entry has the [mtime_ns, size, ok] shape; anything else is a cache miss."""
+    return (
+        isinstance(entry, list)
+        and len(entry) == 3
+        and all(isinstance(value, int) and not isinstance(value, bool) for value in entry[:2])
+        and isinstance(entry[2], bool)
+    )
+
+
+async def _validate_reports(json_files: List[Path]) -> List[bool]:
+    """Validate reports concurrently on a dedicated pool of _REPORT_READ_THREADS reader threads."""
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=_REPORT_READ_THREADS) as executor:
+        return await asyncio.gather(*(
+            loop.run_in_executor(executor, _is_successful_report, json_file)
+            for json_file in json_files
+        ))
+
+
 class MythrilRunner:
     def __init__(self, repo_root: Path, max_workers: int = 4):
         self.repo_root = repo_root
         self.reports_dir = repo_root / "reports" / "mythril"
+        self.index_file = self.reports_dir / ".analyzed_index.json"
         self.max_workers = max_workers
         self.reports_dir.mkdir(parents=True, exist_ok=True)
     
@@ -44,56 +336,46 @@ class MythrilRunner:
         """Get all Solidity contracts to analyze."""
         contracts_dir = self.repo_root / "contracts"
         
-        # Exclude patterns from the original Makefile
-        exclude_patterns = [
-            "*/mocks/*",
-            "*/testing/*", 
-            "*/dependencies/*",
-            "*/dlend/*",
-            "*/interface/*",
-            "*/interfaces/*"
-        ]
-        
-        # Additional patterns to exclude mock and test contracts
-        exclude_filename_patterns = [
-            "Mock",
-            "mock", 
-            "Test",
-            "test",
-            "Fake",
-            "fake"
-        ]
+        # Compiled ASTs already say which sources define concrete contracts; only
+        # sources they miss, or that changed since compiling, are scanned as text
+        compiled_sources = self.get_compiled_sources()
         
         all_contracts = []
-        for sol_file in contracts_dir.rglob("*.sol"):
-            # Check if file matches any exclude pattern
-            relative_path = sol_file.relative_to(self.repo_root)
-            should_exclude = False
-            
-            # Check path patterns
-            for pattern in exclude_patterns:
-                if any(part in pattern.replace("*", "") for part in relative_path.parts):
-                    should_exclude = True
-                    break
+        for dirpath, dirnames, filenames in os.walk(contracts_dir):
+            # Prune excluded directories so their subtrees are never visited
+            dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIR_NAMES]
             
-            # Check filename patterns for mock/test contracts
-            if not should_exclude:
-                filename = sol_file.stem
-                for pattern in exclude_filename_patterns:
-                    if pattern in filename:
-                        should_exclude = True
-                        break
-            
-            if not should_exclude:
-                # Skip abstract contracts and interfaces
+            for name in filenames:
+                if not name.endswith(".sol"):
+                    continue
+                
+                sol_file = Path(dirpath) / name
+                
+                # Skip mock/test contracts and interface files
+                if _EXCLUDE_FILENAME_RE.search(sol_file.stem):
+                    continue
+                
+                compiled = compiled_sources.get(sol_file.relative_to(self.repo_root).as_posix())
+                if compiled is not None:
+                    is_concrete, build_info_mtime_ns = compiled
+                    try:
+                        # Build-info older than the source describes a previous version of it
+                        fresh = build_info_mtime_ns >= sol_file.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    if fresh:
+                        if is_concrete:
+                            all_contracts.append(sol_file)
+                        continue
+                
+                # Skip abstract contracts. A match in the head settles it; otherwise the
+                # rest of the file (if any beyond the head) still has to be checked
                 try:
-                    with open(sol_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if "abstract contract" in content:
-                            continue
-                        # Skip interface files (starting with I and uppercase)
-                        filename = sol_file.stem
-                        if filename.startswith('I') and len(filename) > 1 and filename[1].isupper():
+                    with open(sol_file, 'rb') as f:
+                        content = f.read(_HEAD_READ_BYTES)
+                        if b"abstract contract" not in content and len(content) == _HEAD_READ_BYTES:
+                            content += f.read()
+                        if b"abstract contract" in content:
                             continue
                 except Exception:
                     continue
@@ -102,40 +384,104 @@ class MythrilRunner:
         
         return sorted(all_contracts)
     
+    def get_compiled_sources(self) -> Dict[str, Tuple[bool, int]]:
+        """
+        Classify compiled sources using the hardhat build-info written by compilation.
+        
+        Returns:
+            Mapping of repo-relative source path to (whether it defines a concrete
+            contract, mtime_ns of the build-info it came from), taken from the newest
+            build-info covering the source. Empty if no build-info is available.
+        """
+        build_info_dir = self.repo_root / "artifacts" / "build-info"
+        if not build_info_dir.is_dir():
+            return {}
+        
+        try:
+            build_info_files = sorted(
+                (f.stat().st_mtime_ns, f) for f in build_info_dir.glob("*.json")
+            )
+        except OSError:
+            return {}
+        
+        # Oldest first, so sources in newer build-info overwrite stale classifications
+        sources = {}
+        for build_info_mtime_ns, build_info_file in build_info_files:
+            try:
+                with open(build_info_file, 'rb') as f:
+                    build_info = _json.loads(f.read())
+            except (OSError, ValueError) as e:
+                safe_print(f"⚠️  Ignoring unreadable build-info {build_info_file.name}: {str(e)}")
+                continue
+            
+            for source_path, source in build_info.get('output', {}).get('sources', {}).items():
+                concrete = False
+                abstract = False
+                for node in source.get('ast', {}).get('nodes', []):
+                    if node.get('nodeType') != 'ContractDefinition':
+                        continue
+                    if node.get('abstract'):
+                        abstract = True
+                    elif node.get('contractKind') == 'contract':
+                        concrete = True
+                sources[source_path] = (concrete and not abstract, build_info_mtime_ns)
+        
+        return sources
+    
     def get_analyzed_contracts(self) -> Set[str]:
         """Get set of contracts that have already been successfully analyzed."""
         analyzed = set()
         if self.reports_dir.exists():
+            index = self._load_analyzed_index()
+            updated_index = {}
+            stale = []
+            
             for json_file in self.reports_dir.glob("*.json"):
                 contract_name = json_file.stem
+                if contract_name.startswith('.'):
+                    continue  # Skip bookkeeping files such as the analyzed index
                 
-                # Check if the analysis was successful by examining the JSON content
                 try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        
-                    # Try to parse as JSON
-                    data = json.loads(content)
-                    
-                    # If it has 'success': False, it was a failed analysis we created
-                    if isinstance(data, dict) and data.get('success') is False:
-                        continue  # Skip failed analyses - they should be re-run
-                    
-                    # If it has 'error' key with an actual error message, it was a failed analysis we created
-                    if isinstance(data, dict) and data.get('error') and data.get('error') != None:
-                        continue  # Skip failed analyses - they should be re-run
-                    
-                    # If we get here, it's likely a successful mythril output
-                    # (either has success: true, or error: null, or is standard mythril JSON with issues array)
-                    analyzed.add(contract_name)
-                    
-                except (json.JSONDecodeError, FileNotFoundError, Exception):
-                    # If we can't parse the JSON or read the file, treat as failed analysis
-                    # and let it be re-run
+                    stat = json_file.stat()
+                except OSError:
                     continue
+                
+                # Only re-validate reports that changed since they were last indexed
+                cached = index.get(contract_name)
+                if _is_valid_index_entry(cached) and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    updated_index[contract_name] = [stat.st_mtime_ns, stat.st_size, bool(cached[2])]
+                else:
+                    stale.append((json_file, stat))
+            
+            if stale:
+                # Read and parse changed reports concurrently rather than one after another
+                results = asyncio.run(_validate_reports([json_file for json_file, _ in stale]))
+                for (json_file, stat), ok in zip(stale, results):
+                    updated_index[json_file.stem] = [stat.st_mtime_ns, stat.st_size, ok]
+            
+            analyzed = {name for name, entry in updated_index.items() if entry[2]}
+            
+            if updated_index != index:
+                self._save_analyzed_index(updated_index)
                     
         return analyzed
     
+    def _load_analyzed_index(self) -> Dict[str, List[Any]]:
+        """Load the cached report validation index, or an empty one if missing or unreadable."""
+        try:
+            with open(self.index_file, 'rb') as f:
+                index = _json.loads(f.read())
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_analyzed_index(self, index: Dict[str, List[Any]]):
+        """Persist the report validation index, mapping contract name to [mtime_ns, size, ok]."""
+        try:
+            _atomic_write_bytes(self.index_file, _dump_bytes(index))
+        except OSError as e:
+            safe_print(f"⚠️  Could not write analyzed index: {str(e)}")
+    
     def analyze_single_contract(self, contract_path: Path, timeout: int = 120, 
                               max_depth: Optional[int] = None, 
                               call_depth_limit: Optional[int] = None,
@@ -153,111 +499,15 @@ class MythrilRunner:
         Returns:
             Dictionary with analysis results
         """
-        contract_name = contract_path.stem
-        output_file = self.reports_dir / f"{contract_name}.json"
-        
-        safe_print(f"🔍 Analyzing {contract_path.relative_to(self.repo_root)}...")
-        
-        # Build mythril command
-        cmd = [
-            "myth", "analyze", str(contract_path),
-            "--execution-timeout", str(timeout),
-            "--solv", "0.8.20",
-            "--solc-json", str(self.repo_root / "mythril-config.json"),
-            "-o", "json"
-        ]
-        
-        # Add optional parameters
-        if max_depth:
-            cmd.extend(["--max-depth", str(max_depth)])
-        if call_depth_limit:
-            cmd.extend(["--call-depth-limit", str(call_depth_limit)])
-        if transaction_count:
-            cmd.extend(["-t", str(transaction_count)])
-        
-        start_time = time.time()
-        
-        try:
-            # Run mythril analysis
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout + 30  # Give extra time for process cleanup
-            )
-            
-            analysis_time = time.time() - start_time
-            
-            # Save output to file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(result.stdout)
-            
-            # Determine status
-            if result.returncode == 0:
-                status = "✅ Success"
-                try:
-                    # Try to parse JSON to check for issues
-                    output_data = json.loads(result.stdout)
-                    issue_count = len(output_data.get('issues', []))
-                    if issue_count > 0:
-                        status = f"⚠️  Success ({issue_count} issues)"
-                except json.JSONDecodeError:
-                    status = "✅ Success (no JSON output)"
-            else:
-                status = "❌ Error"
-                if result.stderr:
-                    # Also write stderr to a separate file for debugging
-                    error_file = self.reports_dir / f"{contract_name}_error.txt"
-                    with open(error_file, 'w', encoding='utf-8') as f:
-                        f.write(f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}")
-            
-            safe_print(f"   {status} - {contract_name} ({analysis_time:.1f}s)")
-            
-            return {
-                'contract': contract_name,
-                'path': str(contract_path.relative_to(self.repo_root)),
-                'status': 'success' if result.returncode == 0 else 'error',
-                'analysis_time': analysis_time,
-                'output_file': str(output_file.relative_to(self.repo_root))
-            }
-            
-        except subprocess.TimeoutExpired:
-            safe_print(f"   ⏰ Timeout - {contract_name} (>{timeout}s)")
-            # Create a timeout result file
-            timeout_result = {
-                'success': False,
-                'error': f'Analysis timed out after {timeout} seconds',
-                'issues': []
-            }
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(timeout_result, f, indent=2)
-            
-            return {
-                'contract': contract_name,
-                'path': str(contract_path.relative_to(self.repo_root)),
-                'status': 'timeout',
-                'analysis_time': timeout,
-                'output_file': str(output_file.relative_to(self.repo_root))
-            }
-            
-        except Exception as e:
-            safe_print(f"   💥 Exception - {contract_name}: {str(e)}")
-            # Create an error result file
-            error_result = {
-                'success': False,
-                'error': f'Exception during analysis: {str(e)}',
-                'issues': []
-            }
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(error_result, f, indent=2)
-            
-            return {
-                'contract': contract_name,
-                'path': str(contract_path.relative_to(self.repo_root)),
-                'status': 'exception',
-                'analysis_time': 0,
-                'output_file': str(output_file.relative_to(self.repo_root))
-            }
+        return analyze_contract(
+            self.repo_root,
+            self.reports_dir,
+            contract_path,
+            timeout=timeout,
+            max_depth=max_depth,
+            call_depth_limit=call_depth_limit,
+            transaction_count=transaction_count
+        )
     
     def run_batch_analysis(self, contracts: List[Path], skip_analyzed: bool = True, 
                          timeout: int = 120, **analysis_options) -> List[Dict[str, Any]]:
@@ -284,6 +534,8 @@ class MythrilRunner:
                 safe_print(f"📋 Skipping {skipped_count} already analyzed contracts")
         else:
             contracts_to_analyze = contracts
+            # Every contract is about to append a fresh record, so start the batched file over
+            _reset_result_records(self.reports_dir)
         
         if not contracts_to_analyze:
             safe_print("✨ All contracts already analyzed!")
@@ -292,34 +544,100 @@ class MythrilRunner:
         safe_print(f"🚀 Starting analysis of {len(contracts_to_analyze)} contracts with {self.max_workers} workers...")
         
         results = []
+        pending = iter(contracts_to_analyze)
+        running = {}  # pid -> job state for each live mythril process
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all analysis tasks
-            future_to_contract = {
-                executor.submit(
-                    self.analyze_single_contract, 
-                    contract, 
-                    timeout, 
-                    **analysis_options
-                ): contract 
-                for contract in contracts_to_analyze
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_contract):
-                contract = future_to_contract[future]
+        # Mythril processes are multiplexed on a single selector instead of
+        # dedicating a worker to each one
+        selector = selectors.DefaultSelector()
+        
+        def start_next():
+            """Launch mythril for the next pending contract, if any."""
+            for contract in pending:
+                safe_print(f"🔍 Analyzing {contract.relative_to(self.repo_root)}...")
+                cmd = build_mythril_command(self.repo_root, contract, timeout, **analysis_options)
                 try:
-                    result = future.result()
-                    results.append(result)
+                    proc = subprocess.Popen(
+                        cmd,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        start_new_session=True  # Own process group so timeouts also stop solc children
+                    )
                 except Exception as e:
-                    safe_print(f"💥 Failed to analyze {contract.stem}: {str(e)}")
-                    results.append({
-                        'contract': contract.stem,
-                        'path': str(contract.relative_to(self.repo_root)),
-                        'status': 'failed',
-                        'analysis_time': 0,
-                        'error': str(e)
-                    })
+                    results.append(record_analysis_exception(self.repo_root, self.reports_dir, contract, e))
+                    continue
+                
+                start_time = time.time()
+                job = {
+                    'contract': contract,
+                    'proc': proc,
+                    'start_time': start_time,
+                    'deadline': start_time + timeout + _PROCESS_GRACE_SECONDS,
+                    'stdout': [],
+                    'stderr': [],
+                    'open_streams': 2
+                }
+                selector.register(proc.stdout, selectors.EVENT_READ, (job, 'stdout'))
+                selector.register(proc.stderr, selectors.EVENT_READ, (job, 'stderr'))
+                running[proc.pid] = job
+                return
+        
+        def finish(job: Dict[str, Any]):
+            """Record a finished or overdue mythril process and start the next one."""
+            proc = job['proc']
+            contract = job['contract']
+            for stream in (proc.stdout, proc.stderr):
+                if not stream.closed:
+                    selector.unregister(stream)
+                    stream.close()
+            del running[proc.pid]
+            
+            try:
+                try:
+                    returncode = proc.wait(timeout=max(0, job['deadline'] - time.time()))
+                except subprocess.TimeoutExpired:
+                    _kill_process_group(proc)
+                    results.append(record_analysis_timeout(self.repo_root, self.reports_dir, contract, timeout))
+                else:
+                    results.append(record_analysis_output(
+                        self.repo_root, self.reports_dir, contract, returncode,
+                        b"".join(job['stdout']),
+                        b"".join(job['stderr']),
+                        time.time() - job['start_time']
+                    ))
+            except Exception as e:
+                results.append(record_analysis_exception(self.repo_root, self.reports_dir, contract, e))
+            
+            start_next()
+        
+        try:
+            for _ in range(self.max_workers):
+                start_next()
+            
+            while running:
+                next_deadline = min(job['deadline'] for job in running.values())
+                for key, _ in selector.select(timeout=max(0, next_deadline - time.time())):
+                    job, stream_name = key.data
+                    chunk = os.read(key.fd, _PIPE_READ_BYTES)
+                    if chunk:
+                        job[stream_name].append(chunk)
+                        continue
+                    
+                    # EOF on this stream; the process is done once both streams close
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                    job['open_streams'] -= 1
+                    if job['open_streams'] == 0:
+                        finish(job)
+                
+                now = time.time()
+                for job in [job for job in running.values() if now >= job['deadline']]:
+                    finish(job)
+        finally:
+            # Only non-empty if we are unwinding from an error or interrupt
+            for job in running.values():
+                _kill_process_group(job['proc'])
+            selector.close()
         
         return results
     